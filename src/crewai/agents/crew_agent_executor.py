@@ -71,6 +71,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.iterations = 0
         self.have_forced_answer = False
         self.name_to_tool_map = {tool.name: tool for tool in self.tools}
+        self._normalized_tool_names = {
+            name.casefold().strip() for name in self.name_to_tool_map
+        }
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
         if "system" in self.prompt:
@@ -227,11 +230,11 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         if isinstance(tool_calling, ToolUsageErrorException):
             tool_result = tool_calling.message
         else:
-            if tool_calling.tool_name.casefold().strip() in [
-                name.casefold().strip() for name in self.name_to_tool_map
-            ] or tool_calling.tool_name.casefold().replace("_", " ") in [
-                name.casefold().strip() for name in self.name_to_tool_map
-            ]:
+            if (
+                tool_calling.tool_name.casefold().strip() in self._normalized_tool_names
+                or tool_calling.tool_name.casefold().replace("_", " ")
+                in self._normalized_tool_names
+            ):
                 tool_result = tool_usage.use(tool_calling, agent_action.text)
             else:
                 tool_result = self._i18n.errors("wrong_tool_name").format(
@@ -295,12 +298,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         """Function to handle the process of the training data."""
         agent_id = str(self.agent.id)
 
-        if (
-            CrewTrainingHandler(TRAINING_DATA_FILE).load()
-            and not self.ask_for_human_input
-        ):
+        if not self.ask_for_human_input:
             training_data = CrewTrainingHandler(TRAINING_DATA_FILE).load()
-            if training_data.get(agent_id):
+            if training_data and training_data.get(agent_id):
                 if self.crew is not None and hasattr(self.crew, "_train_iteration"):
                     training_data[agent_id][self.crew._train_iteration][
                         "improved_output"
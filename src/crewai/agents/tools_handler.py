@@ -4,6 +4,9 @@ from ..tools.cache_tools import CacheTools
 from ..tools.tool_calling import InstructorToolCalling, ToolCalling
 from .cache.cache_handler import CacheHandler
 
+# Results of the built-in cache tool are never cached themselves
+CACHE_TOOL_NAME = CacheTools.model_fields["name"].default
+
 
 class ToolsHandler:
     """Callback handler for tool usage."""
@@ -24,7 +27,7 @@ class ToolsHandler:
     ) -> Any:
         """Run when tool ends running."""
         self.last_used_tool = calling  # type: ignore # BUG?: Incompatible types in assignment (expression has type "Union[ToolCalling, InstructorToolCalling]", variable has type "ToolCalling")
-        if self.cache and should_cache and calling.tool_name != CacheTools().name:
+        if self.cache and should_cache and calling.tool_name != CACHE_TOOL_NAME:
             self.cache.add(
                 tool=calling.tool_name,
                 input=calling.arguments,
@@ -1,13 +1,36 @@
+import copy
 import inspect
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 load_dotenv()
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml(config_path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse a config file; (mtime, size) in the key invalidates on edit."""
+    # Binary mode lets libyaml detect and decode the encoding itself
+    with open(config_path, "rb") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def _load_yaml(config_path: Path) -> Any:
+    config_path = Path(config_path).absolute()
+    stat = config_path.stat()
+    config = _parse_yaml(config_path, stat.st_mtime_ns, stat.st_size)
+    # Each crew maps agents, tasks and tools into its config in place
+    return copy.deepcopy(config)
+
+
 def CrewBase(cls):
     class WrappedClass(cls):
         is_crew_class: bool = True  # type: ignore
@@ -29,24 +52,27 @@ def CrewBase(cls):
             self.agents_config = self.load_yaml(agents_config_path)
             self.tasks_config = self.load_yaml(tasks_config_path)
 
+            # Agent and task mapping both need the decorated members, so walk
+            # the class once and share the result.
+            self._all_functions = self._get_all_functions()
             self.map_all_agent_variables()
             self.map_all_task_variables()
 
         @staticmethod
         def load_yaml(config_path: Path):
             try:
-                with open(config_path, "r") as file:
-                    return yaml.safe_load(file)
+                return _load_yaml(config_path)
             except FileNotFoundError:
                 print(f"File not found: {config_path}")
                 raise
 
         def _get_all_functions(self):
-            return {
-                name: getattr(self, name)
-                for name in dir(self)
-                if callable(getattr(self, name))
-            }
+            functions = {}
+            for name in dir(self):
+                attribute = getattr(self, name)
+                if callable(attribute):
+                    functions[name] = attribute
+            return functions
 
         def _filter_functions(
             self, functions: Dict[str, Callable], attribute: str
@@ -58,7 +84,7 @@ def CrewBase(cls):
             }
 
         def map_all_agent_variables(self) -> None:
-            all_functions = self._get_all_functions()
+            all_functions = self._all_functions
             llms = self._filter_functions(all_functions, "is_llm")
             tool_functions = self._filter_functions(all_functions, "is_tool")
             cache_handler_functions = self._filter_functions(
@@ -115,7 +141,7 @@ def CrewBase(cls):
                 )
 
         def map_all_task_variables(self) -> None:
-            all_functions = self._get_all_functions()
+            all_functions = self._all_functions
             agents = self._filter_functions(all_functions, "is_agent")
             tasks = self._filter_functions(all_functions, "is_task")
             output_json_functions = self._filter_functions(
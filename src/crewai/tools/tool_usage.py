@@ -1,8 +1,10 @@
 import ast
 import os
+import threading
 from difflib import SequenceMatcher
+from functools import lru_cache
 from textwrap import dedent
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.task import Task
@@ -18,6 +20,15 @@ if os.environ.get("AGENTOPS_API_KEY"):
         pass
 
 OPENAI_BIGGER_MODELS = ["gpt-4", "gpt-4o", "o1-preview", "o1-mini"]
+DELEGATION_TOOL_NAMES = frozenset(
+    {"Delegate work to coworker", "Ask question to coworker"}
+)
+
+
+@lru_cache(maxsize=128)
+def _acceptable_args(args_schema: Any) -> frozenset:
+    """Argument names accepted by a tool, generated once per args schema."""
+    return frozenset(args_schema.schema()["properties"].keys())
 
 
 class ToolUsageErrorException(Exception):
@@ -42,6 +53,9 @@ class ToolUsage:
       function_calling_llm: Language model to be used for the tool usage.
     """
 
+    _shared_telemetry: Optional[Telemetry] = None
+    _shared_telemetry_lock = threading.Lock()
+
     def __init__(
         self,
         tools_handler: ToolsHandler,
@@ -56,7 +70,7 @@ class ToolUsage:
     ) -> None:
         self._i18n: I18N = I18N()
         self._printer: Printer = Printer()
-        self._telemetry: Telemetry = Telemetry()
+        self._telemetry: Telemetry = self._get_telemetry()
         self._run_attempts: int = 1
         self._max_parsing_attempts: int = 3
         self._remember_format_after_usages: int = 3
@@ -78,6 +92,19 @@ class ToolUsage:
             self._max_parsing_attempts = 2
             self._remember_format_after_usages = 4
 
+    @classmethod
+    def _get_telemetry(cls) -> Telemetry:
+        """Return the Telemetry instance shared by all tool usages."""
+        # A ToolUsage is created for every tool call, so reuse one Telemetry
+        # (and its span exporter) instead of building a new provider each time.
+        if cls._shared_telemetry is None:
+            # Async tasks run on their own threads; the lock is only taken
+            # until the shared instance exists.
+            with cls._shared_telemetry_lock:
+                if cls._shared_telemetry is None:
+                    cls._shared_telemetry = Telemetry()
+        return cls._shared_telemetry
+
     def parse(self, tool_string: str):
         """Parse the tool string and return the tool calling."""
         return self._tool_calling(tool_string)
@@ -139,10 +166,7 @@ class ToolUsage:
 
         if result is None:  #! finecwg: if not result --> if result is None
             try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
+                if calling.tool_name in DELEGATION_TOOL_NAMES:
                     coworker = (
                         calling.arguments.get("coworker") if calling.arguments else None
                     )
@@ -150,7 +174,7 @@ class ToolUsage:
 
                 if calling.arguments:
                     try:
-                        acceptable_args = tool.args_schema.schema()["properties"].keys()  # type: ignore # Item "None" of "type[BaseModel] | None" has no attribute "schema"
+                        acceptable_args = _acceptable_args(tool.args_schema)
                         arguments = {
                             k: v
                             for k, v in calling.arguments.items()
@@ -252,22 +276,22 @@ class ToolUsage:
             )
 
     def _select_tool(self, tool_name: str) -> Any:
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, tool.name.lower().strip(), tool_name.lower().strip()
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            if (
-                tool.name.lower().strip() == tool_name.lower().strip()
-                or SequenceMatcher(
-                    None, tool.name.lower().strip(), tool_name.lower().strip()
-                ).ratio()
-                > 0.85
-            ):
-                return tool
+        normalized_tool_name = tool_name.lower().strip()
+        tools_by_name: Dict[str, Any] = {}
+        for tool in self.tools:
+            tools_by_name.setdefault(tool.name.lower().strip(), tool)
+
+        if (tool := tools_by_name.get(normalized_tool_name)) is not None:
+            return tool
+
+        # Only fall back to fuzzy matching when there is no exact match
+        best_ratio, best_tool = 0.0, None
+        for name, tool in tools_by_name.items():
+            ratio = SequenceMatcher(None, name, normalized_tool_name).ratio()
+            if ratio > best_ratio:
+                best_ratio, best_tool = ratio, tool
+        if best_ratio > 0.85:
+            return best_tool
         self.task.increment_tools_errors()
         if tool_name and tool_name != "":
             raise Exception(
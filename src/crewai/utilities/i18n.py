@@ -1,10 +1,23 @@
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
+@lru_cache(maxsize=32)
+def _read_prompts(path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, str]]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _load_prompts(path: str) -> Dict[str, Dict[str, str]]:
+    """Parse a prompts file once per process, re-reading it only when it changes."""
+    stat = os.stat(path)
+    return _read_prompts(path, stat.st_mtime_ns, stat.st_size)
+
+
 class I18N(BaseModel):
     _prompts: Dict[str, Dict[str, str]] = PrivateAttr()
     prompt_file: Optional[str] = Field(
@@ -17,14 +30,12 @@ class I18N(BaseModel):
         """Load prompts from a JSON file."""
         try:
             if self.prompt_file:
-                with open(self.prompt_file, "r") as f:
-                    self._prompts = json.load(f)
+                self._prompts = _load_prompts(self.prompt_file)
             else:
                 dir_path = os.path.dirname(os.path.realpath(__file__))
                 prompts_path = os.path.join(dir_path, "../translations/en.json")
 
-                with open(prompts_path, "r") as f:
-                    self._prompts = json.load(f)
+                self._prompts = _load_prompts(prompts_path)
         except FileNotFoundError:
             raise Exception(f"Prompt file '{self.prompt_file}' not found.")
         except json.JSONDecodeError:
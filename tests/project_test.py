@@ -1,5 +1,6 @@
 from crewai.agent import Agent
 from crewai.project import agent, task
+from crewai.project.crew_base import _load_yaml
 from crewai.task import Task
 
 
@@ -53,3 +54,22 @@ def test_task_name():
     assert (
         custom_named_task.name == "Custom"
     ), "Custom task name is not being set as expected"
+
+
+def test_load_yaml_returns_independent_copies(tmp_path):
+    config_path = tmp_path / "agents.yaml"
+    config_path.write_text("researcher:\n  role: Researcher\n")
+
+    first_load = _load_yaml(config_path)
+    first_load["researcher"]["role"] = "Changed"
+
+    assert _load_yaml(config_path) == {"researcher": {"role": "Researcher"}}
+
+
+def test_load_yaml_reloads_changed_file(tmp_path):
+    config_path = tmp_path / "agents.yaml"
+    config_path.write_text("researcher:\n  role: Researcher\n")
+    assert _load_yaml(config_path)["researcher"]["role"] == "Researcher"
+
+    config_path.write_text("researcher:\n  role: Senior Researcher\n")
+    assert _load_yaml(config_path)["researcher"]["role"] == "Senior Researcher"
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.tools.tool_usage import ToolUsage, _acceptable_args
+
+
+def _make_tool_usage():
+    return ToolUsage(
+        tools_handler=ToolsHandler(),
+        tools=[],
+        original_tools=[],
+        tools_description="",
+        tools_names="",
+        task=MagicMock(),
+        function_calling_llm=None,
+        agent=MagicMock(),
+        action=MagicMock(),
+    )
+
+
+@pytest.fixture
+def tool_usage():
+    return _make_tool_usage()
+
+
+def test_tool_usages_share_telemetry(tool_usage):
+    other = _make_tool_usage()
+
+    assert tool_usage._telemetry is other._telemetry
+
+
+def test_select_tool_prefers_exact_name(tool_usage):
+    search, search_docs = MagicMock(), MagicMock()
+    search.name = "Search"
+    search_docs.name = "Search docs"
+    tool_usage.tools = [search_docs, search]
+
+    assert tool_usage._select_tool(" search ") is search
+
+
+def test_select_tool_falls_back_to_closest_name(tool_usage):
+    search, calculator = MagicMock(), MagicMock()
+    search.name = "Search the internet"
+    calculator.name = "Calculator"
+    tool_usage.tools = [calculator, search]
+
+    assert tool_usage._select_tool("search the internett") is search
+
+
+def test_select_tool_raises_for_unknown_name(tool_usage):
+    calculator = MagicMock()
+    calculator.name = "Calculator"
+    tool_usage.tools = [calculator]
+
+    with pytest.raises(Exception, match="Action 'search' don't exist"):
+        tool_usage._select_tool("search")
+    tool_usage.task.increment_tools_errors.assert_called_once()
+
+
+def test_acceptable_args_are_cached_per_schema():
+    class SearchSchema(BaseModel):
+        query: str
+        limit: int = 10
+
+    assert _acceptable_args(SearchSchema) == {"query", "limit"}
+    hits = _acceptable_args.cache_info().hits
+    _acceptable_args(SearchSchema)
+    assert _acceptable_args.cache_info().hits == hits + 1
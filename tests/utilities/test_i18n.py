@@ -42,3 +42,18 @@ def test_prompt_file():
     i18n.load_prompts()
     assert isinstance(i18n.retrieve("slices", "role_playing"), str)
     assert i18n.retrieve("slices", "role_playing") == "Lorem ipsum dolor sit amet"
+
+
+def test_prompts_are_parsed_once():
+    assert I18N()._prompts is I18N()._prompts
+
+
+def test_prompt_file_is_reloaded_when_changed(tmp_path):
+    import json
+
+    path = tmp_path / "prompts.json"
+    path.write_text(json.dumps({"slices": {"role_playing": "first"}}))
+    assert I18N(prompt_file=str(path)).slice("role_playing") == "first"
+
+    path.write_text(json.dumps({"slices": {"role_playing": "second one"}}))
+    assert I18N(prompt_file=str(path)).slice("role_playing") == "second one"